@@ -17,6 +17,7 @@ from __future__ import annotations
 import sys
 import tempfile
 from pathlib import Path
+from typing import Any
 
 import pandas as pd
 import streamlit as st
@@ -27,7 +28,6 @@ if str(_PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(_PROJECT_ROOT))
 
 from src.fingering_engine.annotate import annotate, annotations_to_json_bytes  # noqa: E402
-from src.fingering_engine.midi_parser import load_midi  # noqa: E402
 
 # ── Page config ───────────────────────────────────────────────
 st.set_page_config(
@@ -43,6 +43,43 @@ st.markdown(
 )
 st.divider()
 
+
+# ── Cached pipeline ───────────────────────────────────────────
+# Bounded, so a long-running server does not keep every upload's
+# results in memory
+@st.cache_data(show_spinner=False, max_entries=32)
+def _run_pipeline(
+    midi_bytes: bytes, export_midi: bool
+) -> tuple[list[dict[str, Any]], bytes | None]:
+    """Run the fingering pipeline on uploaded MIDI bytes.
+
+    Streamlit reruns the whole script on every widget interaction;
+    caching on the uploaded bytes means each file is solved only once.
+
+    Returns:
+        ``(annotations, annotated_midi_bytes)`` — the MIDI bytes are
+        ``None`` unless *export_midi* is set.
+    """
+    with tempfile.TemporaryDirectory() as work_dir:
+        # Write the bytes to a temp file so the MIDI parser can open it
+        midi_path = Path(work_dir) / "upload.mid"
+        midi_path.write_bytes(midi_bytes)
+        annotations = annotate(
+            midi_path=midi_path,
+            output_dir=work_dir,
+            export_midi=export_midi,
+            # _run_pipeline caches uploads in memory; skip the disk cache
+            cache_notes=False,
+        )
+
+        midi_out_bytes: bytes | None = None
+        midi_out = Path(work_dir) / f"{midi_path.stem}_annotated.mid"
+        if export_midi and midi_out.exists():
+            midi_out_bytes = midi_out.read_bytes()
+
+    return annotations, midi_out_bytes
+
+
 # ── File uploader ─────────────────────────────────────────────
 uploaded_file = st.file_uploader(
     "Choose a MIDI file",
@@ -53,11 +90,6 @@ uploaded_file = st.file_uploader(
 if uploaded_file is not None:
     st.success(f"Loaded: **{uploaded_file.name}**")
 
-    # Write the uploaded bytes to a temp file so pretty_midi can open it
-    with tempfile.NamedTemporaryFile(suffix=".mid", delete=False) as tmp:
-        tmp.write(uploaded_file.getvalue())
-        tmp_path = Path(tmp.name)
-
     # ── Run button ────────────────────────────────────────────
     col_run, col_midi = st.columns([1, 1])
     export_midi: bool = col_midi.checkbox("Also export annotated MIDI", value=False)
@@ -65,49 +97,41 @@ if uploaded_file is not None:
 
     if run_clicked:
         with st.spinner("Running DP solver …"):
-            with tempfile.TemporaryDirectory() as out_dir:
-                annotations = annotate(
-                    midi_path=tmp_path,
-                    output_dir=out_dir,
-                    export_midi=export_midi,
-                )
-
-                # ── Summary stats ─────────────────────────────
-                st.subheader("Summary")
-                total_notes = len(annotations)
-                left_count = sum(1 for a in annotations if a["hand"] == "L")
-                right_count = total_notes - left_count
-
-                c1, c2, c3 = st.columns(3)
-                c1.metric("Total Notes", total_notes)
-                c2.metric("Left Hand", left_count)
-                c3.metric("Right Hand", right_count)
-
-                # ── Annotation table ──────────────────────────
-                st.subheader("Annotation Table")
-                df = pd.DataFrame(annotations)
-                df.columns = ["Onset (s)", "Pitch", "Hand", "Finger"]
-                st.dataframe(df, use_container_width=True, height=400)
-
-                # ── Downloads ─────────────────────────────────
-                st.subheader("Downloads")
-                json_bytes = annotations_to_json_bytes(annotations)
-                st.download_button(
-                    label="⬇  Download annotations.json",
-                    data=json_bytes,
-                    file_name=f"{uploaded_file.name.rsplit('.', 1)[0]}_annotations.json",
-                    mime="application/json",
-                )
-
-                if export_midi:
-                    midi_out = Path(out_dir) / f"{tmp_path.stem}_annotated.mid"
-                    if midi_out.exists():
-                        st.download_button(
-                            label="⬇  Download annotated MIDI",
-                            data=midi_out.read_bytes(),
-                            file_name=f"{uploaded_file.name.rsplit('.', 1)[0]}_annotated.mid",
-                            mime="audio/midi",
-                        )
-
-    # Clean up temp file reference (OS will remove on reboot if not sooner)
-    # We intentionally do NOT delete it here because Streamlit may re-run.
+            annotations, midi_out_bytes = _run_pipeline(
+                uploaded_file.getvalue(), export_midi
+            )
+
+        # ── Summary stats ─────────────────────────────────────
+        st.subheader("Summary")
+        total_notes = len(annotations)
+        left_count = sum(1 for a in annotations if a["hand"] == "L")
+        right_count = total_notes - left_count
+
+        c1, c2, c3 = st.columns(3)
+        c1.metric("Total Notes", total_notes)
+        c2.metric("Left Hand", left_count)
+        c3.metric("Right Hand", right_count)
+
+        # ── Annotation table ──────────────────────────────────
+        st.subheader("Annotation Table")
+        df = pd.DataFrame(annotations)
+        df.columns = ["Onset (s)", "Pitch", "Hand", "Finger"]
+        st.dataframe(df, use_container_width=True, height=400)
+
+        # ── Downloads ─────────────────────────────────────────
+        st.subheader("Downloads")
+        json_bytes = annotations_to_json_bytes(annotations)
+        st.download_button(
+            label="⬇  Download annotations.json",
+            data=json_bytes,
+            file_name=f"{uploaded_file.name.rsplit('.', 1)[0]}_annotations.json",
+            mime="application/json",
+        )
+
+        if midi_out_bytes is not None:
+            st.download_button(
+                label="⬇  Download annotated MIDI",
+                data=midi_out_bytes,
+                file_name=f"{uploaded_file.name.rsplit('.', 1)[0]}_annotated.mid",
+                mime="audio/midi",
+            )
@@ -5,5 +5,6 @@ Sub-package containing:
     feature_builder  – deterministic feature computation
     cost_model       – configurable transition cost functions
     solver           – DP graph-search optimizer
+    kernel           – numba-compiled DP forward pass (optional)
     annotate         – orchestrates pipeline and exports results
 """
@@ -1,7 +1,8 @@
 """Annotator — orchestrate the full fingering pipeline and export results.
 
 Responsibilities:
-    1. Call the MIDI parser to load and extract notes.
+    1. Call the MIDI parser to load and extract notes (optionally cached
+       on disk).
     2. Call the feature builder to enrich notes with features.
     3. Call the DP solver to compute optimal fingering.
     4. Save ``annotations.json`` (default: ``data/annotations/``).
@@ -17,7 +18,12 @@ from typing import Any
 
 import pretty_midi
 
-from .midi_parser import load_midi, extract_notes
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib
+    orjson = None
+
+from .midi_parser import parse_midi, parse_midi_cached
 from .feature_builder import build_features
 from .solver import solve
 
@@ -27,6 +33,7 @@ def annotate(
     output_dir: str | Path | None = None,
     config_path: str | Path | None = None,
     export_midi: bool = False,
+    cache_notes: bool = True,
 ) -> list[dict[str, Any]]:
     """Run the full fingering-estimation pipeline on a MIDI file.
 
@@ -37,6 +44,9 @@ def annotate(
         config_path: Path to the cost-config YAML.
             Defaults to ``configs/fingering_costs.yaml``.
         export_midi: If ``True``, also save an annotated MIDI file.
+        cache_notes: If ``True``, reuse / store the extracted notes in
+            the on-disk MIDI cache (see :func:`parse_midi_cached`).
+            Callers that see each file once should pass ``False``.
 
     Returns:
         List of annotation dicts, each containing:
@@ -52,19 +62,20 @@ def annotate(
     output_dir.mkdir(parents=True, exist_ok=True)
 
     # ── Pipeline ──────────────────────────────────────────────
-    midi_data = load_midi(midi_path)
-    notes = extract_notes(midi_data)
+    notes = parse_midi_cached(midi_path) if cache_notes else parse_midi(midi_path)
     features = build_features(notes)
     annotations = solve(features, config_path=config_path)
 
     # ── Save annotations.json ─────────────────────────────────
     stem = midi_path.stem  # filename without extension (safe with spaces/commas)
     json_path = output_dir / f"{stem}_annotations.json"
-    with open(json_path, "w", encoding="utf-8") as fh:
-        json.dump(annotations, fh, indent=2, ensure_ascii=False)
+    json_path.write_bytes(annotations_to_json_bytes(annotations))
 
     # ── Optional: export annotated MIDI ───────────────────────
     if export_midi:
+        # Lyric export still goes through pretty_midi, which needs the
+        # full event data rather than the extracted note columns
+        midi_data = pretty_midi.PrettyMIDI(str(midi_path))
         _export_annotated_midi(midi_data, annotations, output_dir, stem)
 
     return annotations
@@ -90,11 +101,12 @@ def _export_annotated_midi(
     Returns:
         Path to the saved annotated MIDI file.
     """
-    for ann in annotations:
-        label = f"H{ann['hand']}F{ann['finger']}"
-        midi_data.lyrics.append(
-            pretty_midi.Lyric(text=label, time=ann["onset_time"])
-        )
+    midi_data.lyrics.extend(
+        [
+            pretty_midi.Lyric(text=f"H{ann['hand']}F{ann['finger']}", time=ann["onset_time"])
+            for ann in annotations
+        ]
+    )
 
     midi_out_path = output_dir / f"{stem}_annotated.mid"
     midi_data.write(str(midi_out_path))
@@ -104,10 +116,18 @@ def _export_annotated_midi(
 def annotations_to_json_bytes(annotations: list[dict[str, Any]]) -> bytes:
     """Serialise annotations to UTF-8 JSON bytes (for download buttons).
 
+    Uses *orjson* when installed (it emits bytes directly), otherwise
+    the stdlib ``json`` module with the same 2-space indentation.
+    NumPy scalars (e.g. ``np.float64`` onsets) are accepted by both.
+
     Args:
         annotations: The list of annotation dicts.
 
     Returns:
         UTF-8 encoded JSON bytes.
     """
+    if orjson is not None:
+        return orjson.dumps(
+            annotations, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        )
     return json.dumps(annotations, indent=2, ensure_ascii=False).encode("utf-8")
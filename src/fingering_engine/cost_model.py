@@ -1,6 +1,7 @@
 """Cost Model — configurable transition-cost functions for piano fingering.
 
-All weights are loaded from ``configs/fingering_costs.yaml``.
+All weights are loaded from ``configs/fingering_costs.yaml`` (or an
+already-parsed config dict with the same keys).
 No hardcoded constants: if a required key is missing the YAML,
 a ``ValueError`` is raised with a clear message.
 
@@ -11,35 +12,88 @@ Methods:
     hand_switch_cost  – penalises changing hands between consecutive notes
     chord_penalty     – penalises chords wider than one hand span
     total_cost        – aggregated transition cost
+    total_cost_int    – fixed-point ``total_cost`` for the integer DP
 """
 
 from __future__ import annotations
 
+import functools
+import warnings
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader  # libyaml C backend
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+
+# Fixed-point scale for integer costs: 1 cost unit = COST_SCALE ticks.
+# A power of two, so weights built from the config by the trainer's
+# multipliers (0.25, 0.75, 1.25, …) stay exact instead of rounding.
+COST_SCALE: int = 1 << 12
+
+
+@functools.lru_cache(maxsize=8)
+def _load_cfg(path: str, mtime_ns: int) -> dict[str, Any]:
+    """Parse a cost-config YAML file, cached on ``(path, mtime)``.
+
+    The modification time is part of the key so an edited file is
+    re-read.  The returned dict is shared between callers and must not
+    be mutated.
+    """
+    with open(path, "r", encoding="utf-8") as fh:
+        return yaml.load(fh, Loader=_SafeLoader)
+
+
+def _quantise(weight: float, key: str) -> int:
+    """Convert *weight* to ``1 / COST_SCALE`` units, warning if inexact."""
+    ticks = weight * COST_SCALE
+    if not ticks.is_integer():
+        warnings.warn(
+            f"Cost weight '{key}' = {weight} is not a multiple of "
+            f"1/{COST_SCALE}; it is rounded for the fixed-point DP, "
+            "which may break near-ties differently",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+    return round(ticks)
+
 
 class FingeringCostModel:
     """Rule-based cost model for evaluating finger transitions.
 
     Args:
         config_path: Path to the YAML configuration file.
+        config: Already-parsed configuration dict.  Takes precedence over
+            *config_path*, so callers that build configs in memory (e.g.
+            the trainer) skip the YAML round-trip.  Not mutated.
     """
 
-    def __init__(self, config_path: str | Path | None = None) -> None:
-        if config_path is None:
-            # Default: configs/fingering_costs.yaml relative to project root
-            config_path = Path(__file__).resolve().parents[2] / "configs" / "fingering_costs.yaml"
+    def __init__(
+        self,
+        config_path: str | Path | None = None,
+        config: dict[str, Any] | None = None,
+    ) -> None:
+        if config is not None:
+            self._cfg: dict[str, Any] = config
+            config_path = "<in-memory config>"
         else:
-            config_path = Path(config_path)
+            if config_path is None:
+                # Default: configs/fingering_costs.yaml relative to project root
+                config_path = Path(__file__).resolve().parents[2] / "configs" / "fingering_costs.yaml"
+            else:
+                config_path = Path(config_path)
 
-        if not config_path.exists():
-            raise FileNotFoundError(f"Cost config not found: {config_path}")
+            if not config_path.exists():
+                raise FileNotFoundError(f"Cost config not found: {config_path}")
 
-        with open(config_path, "r", encoding="utf-8") as fh:
-            self._cfg: dict[str, Any] = yaml.safe_load(fh)
+            self._cfg = _load_cfg(
+                str(config_path.resolve()), config_path.stat().st_mtime_ns
+            )
 
         # Validate required top-level keys
         required_keys = [
@@ -67,6 +121,43 @@ class FingeringCostModel:
         self.weak_finger_weight: float = float(self._cfg["weak_finger_weight"])
         self.split_pitch: int = int(self._cfg["split_pitch"])
 
+        # Symmetric span table indexed by finger number (row/col 0 unused)
+        self._span: np.ndarray = np.zeros((6, 6), dtype=np.int8)
+        for lo in range(1, 6):
+            for hi in range(lo + 1, 6):
+                key = f"{lo}_{hi}"
+                max_span = self.max_comfortable_span.get(key)
+                if max_span is None:
+                    raise ValueError(
+                        f"Missing max_comfortable_span entry for finger pair '{key}'"
+                    )
+                # The table is int8: only whole semitone spans fit exactly
+                try:
+                    valid = (
+                        not isinstance(max_span, bool)
+                        and float(max_span).is_integer()
+                        and 0 <= max_span <= 127
+                    )
+                except (TypeError, ValueError):
+                    valid = False
+                if not valid:
+                    raise ValueError(
+                        f"Invalid max_comfortable_span entry for finger pair '{key}': "
+                        f"expected a whole number of semitones in 0–127, got {max_span!r}"
+                    )
+                self._span[lo, hi] = self._span[hi, lo] = int(max_span)
+
+        # ── Pre-bound values for total_cost_int ───────────────
+        # Flat copy of the span table indexed by ``finger_a * 6 + finger_b``
+        self._span_arr: tuple[int, ...] = tuple(self._span.ravel().tolist())
+        # Weights quantised to ``1 / COST_SCALE`` units
+        self._sw_q: int = _quantise(self.stretch_weight, "stretch_weight")
+        self._cw_q: int = _quantise(self.crossing_weight, "crossing_weight")
+        self._rw_q: int = _quantise(self.repetition_weight, "repetition_weight")
+        self._hsw_q: int = _quantise(self.hand_switch_weight, "hand_switch_weight")
+        self._cpw_q: int = _quantise(self.chord_penalty_weight, "chord_penalty_weight")
+        self._wfw_q: int = _quantise(self.weak_finger_weight, "weak_finger_weight")
+
     # ── Individual cost components ────────────────────────────
 
     def stretch_cost(self, finger_a: int, finger_b: int, interval: int) -> float:
@@ -83,14 +174,7 @@ class FingeringCostModel:
         # Same finger → no stretch (handled by repetition_cost)
         if finger_a == finger_b:
             return 0.0
-        lo, hi = sorted([finger_a, finger_b])
-        key = f"{lo}_{hi}"
-        max_span = self.max_comfortable_span.get(key)
-        if max_span is None:
-            raise ValueError(
-                f"Missing max_comfortable_span entry for finger pair '{key}'"
-            )
-        excess = interval - max_span
+        excess = interval - int(self._span[finger_a, finger_b])
         if excess <= 0:
             return 0.0
         return excess * self.stretch_weight
@@ -112,16 +196,14 @@ class FingeringCostModel:
         Returns:
             Non-negative cost.
         """
-        pitch_up = pitch_b > pitch_a
-        finger_up = finger_b > finger_a
-
-        # Same finger or same pitch → no crossing
-        if finger_a == finger_b or pitch_a == pitch_b:
-            return 0.0
-
-        if pitch_up != finger_up:
-            return self.crossing_weight
-        return 0.0
+        # Directions disagree, excluding same finger / same pitch
+        # (computed branch-free; bools combine with & and ^)
+        crossing = (
+            ((pitch_b > pitch_a) ^ (finger_b > finger_a))
+            & (finger_a != finger_b)
+            & (pitch_a != pitch_b)
+        )
+        return crossing * self.crossing_weight
 
     def repetition_cost(self, finger_a: int, finger_b: int, pitch_a: int, pitch_b: int) -> float:
         """Penalise using the same finger on consecutive *different* pitches.
@@ -226,3 +308,66 @@ class FingeringCostModel:
         cost += self.weak_finger_cost(finger_b)
 
         return cost
+
+    def total_cost_int(
+        self,
+        fa: int,
+        fb: int,
+        pa: int,
+        pb: int,
+        ha: str,
+        hb: str,
+        cs: int = 1,
+    ) -> int:
+        """Fixed-point, inlined equivalent of :meth:`total_cost`.
+
+        Weights and the span table are read from pre-bound attributes in
+        one statement, avoiding the per-component method calls and
+        attribute loads of :meth:`total_cost` (the solver calls this
+        for every cell of its transition matrices).
+
+        Every weight is quantised to an integer number of
+        ``1 / COST_SCALE`` units, so the result is an exact integer sum
+        with no rounding or ordering effects.  Weights that are
+        multiples of ``1 / COST_SCALE`` (any binary fraction down to
+        1/4096, e.g. 0.0625 or 0.3125) are represented exactly, so
+        the DP picks the same path as with float :meth:`total_cost`;
+        other weights are rounded to the nearest unit (with a
+        ``RuntimeWarning``), which can break near-ties differently.
+
+        Args:
+            fa: Previous finger (1–5).
+            fb: Current finger (1–5).
+            pa: Previous MIDI pitch.
+            pb: Current MIDI pitch.
+            ha: Previous hand (``"L"`` or ``"R"``).
+            hb: Current hand (``"L"`` or ``"R"``).
+            cs: Number of simultaneous notes at the current onset.
+
+        Returns:
+            Aggregated non-negative cost in ``1 / COST_SCALE`` units.
+        """
+        sw, cw, rw, hsw, cpw, wfw, span = (
+            self._sw_q, self._cw_q, self._rw_q, self._hsw_q, self._cpw_q, self._wfw_q,
+            self._span_arr,
+        )
+
+        cost = 0
+        if ha == hb:
+            if fa != fb:
+                excess = abs(pb - pa) - span[fa * 6 + fb]
+                if excess > 0:
+                    cost += excess * sw
+                if pa != pb and (pb > pa) != (fb > fa):
+                    cost += cw
+            elif pa != pb:
+                cost += rw
+        else:
+            cost += hsw
+
+        if cs > 5:
+            cost += (cs - 5) * cpw
+        if fb >= 4:
+            cost += wfw
+
+        return cost
@@ -12,8 +12,11 @@ All computations are deterministic — no randomness, no learned parameters.
 
 from __future__ import annotations
 
+import heapq
 from typing import Any
 
+import numpy as np
+
 
 # ── Pitch register boundaries ──────────────────────────────────
 # These are advisory hints only; the solver may override them.
@@ -37,19 +40,19 @@ def _pitch_register(pitch: int) -> str:
     return "mid"
 
 
-def build_features(notes: list[dict[str, Any]]) -> list[dict[str, Any]]:
+def build_features(notes: dict[str, np.ndarray]) -> list[dict[str, Any]]:
     """Compute deterministic features for a sequence of notes.
 
-    The input ``notes`` list **must** already be sorted by ``(start, pitch)``
+    The input columns **must** already be sorted by ``(start, pitch)``
     (as returned by :func:`midi_parser.extract_notes`).
 
     Args:
-        notes: Sorted list of note dicts with at least
-            ``pitch``, ``start``, ``end``, ``duration``, ``velocity``.
+        notes: Sorted note columns — a dict of equal-length arrays with
+            at least ``pitch``, ``start``, ``end``, ``duration``, ``velocity``.
 
     Returns:
-        A new list where each element is a copy of the original note dict
-        augmented with additional feature keys:
+        A list with one dict per note holding the original note fields
+        (as plain Python scalars) augmented with additional feature keys:
             - ``index``          (int)
             - ``delta_pitch``    (int | None)    — None for the first note
             - ``delta_time``     (float | None)  — None for the first note
@@ -57,35 +60,43 @@ def build_features(notes: list[dict[str, Any]]) -> list[dict[str, Any]]:
             - ``overlap_count``  (int)           — notes still sounding at this onset
             - ``pitch_register`` (str)           — "low" / "mid" / "high"
     """
-    if not notes:
+    if len(notes["pitch"]) == 0:
         return []
 
+    # Convert columns to Python lists once: scalar indexing into NumPy
+    # arrays is slow and the results must stay JSON-serialisable.
+    columns: dict[str, list[Any]] = {key: arr.tolist() for key, arr in notes.items()}
+    pitches: list[int] = columns["pitch"]
+    starts: list[float] = columns["start"]
+    ends: list[float] = columns["end"]
+    n = len(pitches)
+
     # ── Pre-compute chord groups ───────────────────────────────
     # Two notes belong to the same chord when their onsets are
     # essentially identical (< 30 ms tolerance for MIDI quantisation).
     chord_tolerance: float = 0.03  # seconds
 
-    chord_sizes: list[int] = []
-    group_start: int = 0
-    for i, note in enumerate(notes):
-        # Detect group boundary
-        if i > 0 and abs(note["start"] - notes[group_start]["start"]) > chord_tolerance:
-            group_start = i
-        # We'll fill actual sizes in a second pass
-        chord_sizes.append(group_start)
-
-    # Second pass: compute group size for each note
-    # group_start_indices maps group_start → count
-    from collections import Counter
-
-    group_counts = Counter(chord_sizes)
-    chord_size_list: list[int] = [group_counts[gs] for gs in chord_sizes]
+    # Onsets are sorted, so each chord is a contiguous run starting at
+    # ``lo``; ``hi`` advances to the first note outside the tolerance.
+    chord_size_list: list[int] = [0] * n
+    lo: int = 0
+    while lo < n:
+        hi = lo + 1
+        while hi < n and starts[hi] - starts[lo] <= chord_tolerance:
+            hi += 1
+        chord_size_list[lo:hi] = [hi - lo] * (hi - lo)
+        lo = hi
 
     # ── Build feature list ────────────────────────────────────
     enriched: list[dict[str, Any]] = []
 
-    for i, note in enumerate(notes):
-        feat: dict[str, Any] = dict(note)  # shallow copy
+    # Min-heap of end times for earlier notes that may still be sounding.
+    # Onsets are non-decreasing, so a note that has ended before this
+    # onset has also ended before every later one and can be dropped.
+    active: list[float] = []
+
+    for i in range(n):
+        feat: dict[str, Any] = {key: values[i] for key, values in columns.items()}
         feat["index"] = i
 
         # Interval / time delta from previous note
@@ -93,21 +104,20 @@ def build_features(notes: list[dict[str, Any]]) -> list[dict[str, Any]]:
             feat["delta_pitch"] = None
             feat["delta_time"] = None
         else:
-            feat["delta_pitch"] = note["pitch"] - notes[i - 1]["pitch"]
-            feat["delta_time"] = round(note["start"] - notes[i - 1]["start"], 6)
+            feat["delta_pitch"] = pitches[i] - pitches[i - 1]
+            feat["delta_time"] = round(starts[i] - starts[i - 1], 6)
 
         # Chord size
         feat["chord_size"] = chord_size_list[i]
 
         # Overlap count: how many earlier notes are still sounding?
-        overlap: int = 0
-        for j in range(i):
-            if notes[j]["end"] > note["start"]:
-                overlap += 1
-        feat["overlap_count"] = overlap
+        while active and active[0] <= starts[i]:
+            heapq.heappop(active)
+        feat["overlap_count"] = len(active)
+        heapq.heappush(active, ends[i])
 
         # Pitch register hint
-        feat["pitch_register"] = _pitch_register(note["pitch"])
+        feat["pitch_register"] = _pitch_register(pitches[i])
 
         enriched.append(feat)
 
@@ -0,0 +1,207 @@
+"""Kernel — compiled DP forward pass for the fingering solver.
+
+The forward pass is a tight numeric loop over ``n × 10 × 10`` state
+transitions, so it is compiled to native code with *numba* when the
+package is installed.  Every helper mirrors the fixed-point
+:meth:`FingeringCostModel.total_cost_int` exactly, so both solver
+paths return identical paths.
+
+Inputs are plain NumPy arrays — no dicts, no strings:
+    - ``pitches``      : int16[n]   MIDI pitch per note
+    - ``chord_sizes``  : int16[n]   simultaneous notes per onset
+    - ``weights``      : int64[6]   quantised stretch, crossing, repetition,
+                         hand-switch, chord-penalty, weak-finger weights
+    - ``span``         : int8[6, 6] symmetric max comfortable span,
+                         indexed by finger number (row / column 0 unused)
+    - ``dp0``          : int32[10]  initial state costs for note 0
+
+States use the solver layout ``hand_index * 5 + (finger - 1)``.
+:func:`forward` is compiled ahead of time for exactly these types
+(:data:`FORWARD_SIGNATURE`), so the first solve pays no JIT latency.
+
+If *numba* is not installed, :data:`HAVE_NUMBA` is ``False`` and the
+solver falls back to its vectorised NumPy path.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional
+    njit = None
+
+HAVE_NUMBA: bool = njit is not None
+
+# ── Weight vector layout ──────────────────────────────────────
+W_STRETCH: int = 0
+W_CROSSING: int = 1
+W_REPETITION: int = 2
+W_HAND_SWITCH: int = 3
+W_CHORD_PENALTY: int = 4
+W_WEAK_FINGER: int = 5
+
+
+# Concrete types of the arrays the solver passes to :func:`forward`
+FORWARD_SIGNATURE: str = (
+    "Tuple((int32[:, :], int8[:, :]))"
+    "(int16[:], int16[:], int64[:], int8[:, :], int32[:])"
+)
+
+
+def _jit(func=None, *, signature=None):
+    """Compile with numba when available, else return the function unchanged.
+
+    With a *signature* the function is compiled eagerly, at import time,
+    instead of on first call; ``cache=True`` persists the machine code
+    so later imports load it from disk.
+    """
+    def decorate(f):
+        if not HAVE_NUMBA:
+            return f
+        if signature is None:
+            return njit(cache=True)(f)
+        return njit(signature, cache=True)(f)
+
+    return decorate if func is None else decorate(func)
+
+
+@_jit
+def _stretch_cost(finger_a, finger_b, interval, span, stretch_weight):
+    """Mirror of :meth:`FingeringCostModel.stretch_cost`."""
+    if finger_a == finger_b:
+        return 0
+    excess = interval - np.int64(span[finger_a, finger_b])
+    if excess <= 0:
+        return 0
+    return excess * stretch_weight
+
+
+@_jit
+def _crossing_cost(finger_a, finger_b, pitch_a, pitch_b, crossing_weight):
+    """Mirror of :meth:`FingeringCostModel.crossing_cost` (branch-free)."""
+    crossing = (
+        ((pitch_b > pitch_a) ^ (finger_b > finger_a))
+        & (finger_a != finger_b)
+        & (pitch_a != pitch_b)
+    )
+    return np.int64(crossing) * crossing_weight
+
+
+@_jit
+def _repetition_cost(finger_a, finger_b, pitch_a, pitch_b, repetition_weight):
+    """Mirror of :meth:`FingeringCostModel.repetition_cost`."""
+    if finger_a == finger_b and pitch_a != pitch_b:
+        return repetition_weight
+    return 0
+
+
+@_jit
+def _transition_cost(finger_a, finger_b, pitch_a, pitch_b, hand_a, hand_b,
+                     chord_size, weights, span):
+    """Mirror of :meth:`FingeringCostModel.total_cost_int` (hands as 0 / 1)."""
+    interval = abs(pitch_b - pitch_a)
+
+    cost = 0
+    if hand_a == hand_b:
+        cost += _stretch_cost(finger_a, finger_b, interval, span, weights[W_STRETCH])
+        cost += _crossing_cost(finger_a, finger_b, pitch_a, pitch_b, weights[W_CROSSING])
+        cost += _repetition_cost(finger_a, finger_b, pitch_a, pitch_b, weights[W_REPETITION])
+    else:
+        cost += weights[W_HAND_SWITCH]
+
+    excess = chord_size - 5
+    if excess > 0:
+        cost += excess * weights[W_CHORD_PENALTY]
+
+    if finger_b == 4 or finger_b == 5:
+        cost += weights[W_WEAK_FINGER]
+
+    return cost
+
+
+@_jit
+def _transition_lower_bound(finger_b, chord_size, weights):
+    """Smallest possible transition cost into *finger_b* from any state.
+
+    The stretch, crossing, repetition and hand-switch terms can all be
+    zero for some predecessor, so only the chord and weak-finger terms
+    (which depend on the current note alone) are guaranteed.
+    """
+    cost = 0
+
+    excess = chord_size - 5
+    if excess > 0:
+        cost += excess * weights[W_CHORD_PENALTY]
+
+    if finger_b == 4 or finger_b == 5:
+        cost += weights[W_WEAK_FINGER]
+
+    return cost
+
+
+@_jit(signature=FORWARD_SIGNATURE)
+def forward(pitches, chord_sizes, weights, span, dp0):
+    """Run the DP forward pass.
+
+    Predecessors are visited in order of increasing cumulative cost;
+    once ``dp[i-1, a]`` plus the transition lower bound exceeds the best
+    total found so far, no remaining predecessor can win and the scan
+    stops.  Ties are still resolved toward the lowest state index, so
+    the pruned search returns exactly the same path as a full scan.
+
+    Each row is re-based on its minimum after it is filled, which keeps
+    every comparison unchanged while bounding the ``int32`` sums.
+
+    Returns:
+        ``(dp, bp)`` — ``int32[n, 10]`` re-based cumulative costs and
+        ``int8[n, 10]`` predecessor states (``-1`` for note 0).
+    """
+    n = pitches.shape[0]
+    num_states = dp0.shape[0]
+    dp = np.empty((n, num_states), dtype=np.int32)
+    bp = np.full((n, num_states), -1, dtype=np.int8)
+    dp[0, :] = dp0
+
+    # The lower bound only holds for non-negative weights
+    can_prune = weights.min() >= 0
+    no_bound = np.iinfo(np.int64).min // 2
+
+    for i in range(1, n):
+        pitch_a = np.int64(pitches[i - 1])
+        pitch_b = np.int64(pitches[i])
+        chord_size = np.int64(chord_sizes[i])
+        order = np.argsort(dp[i - 1], kind="mergesort")
+
+        for sb in range(num_states):
+            hand_b = sb // 5
+            finger_b = sb % 5 + 1
+            best_cost = np.iinfo(np.int64).max
+            best_prev = 0
+            if can_prune:
+                lower_bound = _transition_lower_bound(finger_b, chord_size, weights)
+            else:
+                lower_bound = no_bound
+
+            for k in range(num_states):
+                sa = order[k]
+                prev_cost = np.int64(dp[i - 1, sa])
+                if prev_cost + lower_bound > best_cost:
+                    break
+
+                trans = _transition_cost(
+                    sa % 5 + 1, finger_b, pitch_a, pitch_b,
+                    sa // 5, hand_b, chord_size, weights, span,
+                )
+                total = prev_cost + trans
+                if total < best_cost or (total == best_cost and sa < best_prev):
+                    best_cost = total
+                    best_prev = sa
+
+            dp[i, sb] = best_cost
+            bp[i, sb] = best_prev
+
+        dp[i, :] -= dp[i, :].min()
+
+    return dp, bp
@@ -1,31 +1,44 @@
 """MIDI Parser — load and extract structured note data from MIDI files.
 
 Responsibilities:
-    - Load a MIDI file via *pretty_midi*.
-    - Extract **all** NOTE_ON events across all instruments.
-    - Return a sorted list of note dictionaries with:
+    - Load a MIDI file via *symusic* (C++ parser, tick resolution).
+    - Extract **all** NOTE_ON events across all non-drum tracks.
+    - Convert ticks to seconds with the file's tempo map (float64).
+    - Return sorted note columns as a dict of NumPy arrays:
         pitch, start, end, duration, velocity
+    - Cache extracted notes on disk, keyed on the file's content hash.
 
 No fingering logic lives here.
 """
 
 from __future__ import annotations
 
+import contextlib
+import hashlib
+import os
+import tempfile
 from pathlib import Path
-from typing import Any
 
-import pretty_midi
+import numpy as np
+import symusic
 
 
-def load_midi(midi_path: str | Path) -> pretty_midi.PrettyMIDI:
-    """Load a MIDI file and return a PrettyMIDI object.
+# Column-oriented note data: one equal-length array per field
+NoteArrays = dict[str, np.ndarray]
+
+# Default on-disk cache for extracted notes (project-relative)
+_DEFAULT_CACHE_DIR: Path = Path(__file__).resolve().parents[2] / ".cache" / "midi"
+
+
+def load_midi(midi_path: str | Path) -> symusic.Score:
+    """Load a MIDI file and return a tick-resolution symusic Score.
 
     Args:
         midi_path: Path to the ``.mid`` / ``.midi`` file.
             May contain spaces or commas — handled via *pathlib.Path*.
 
     Returns:
-        A ``pretty_midi.PrettyMIDI`` instance.
+        A ``symusic.Score`` with times in MIDI ticks.
 
     Raises:
         FileNotFoundError: If *midi_path* does not exist.
@@ -36,59 +49,178 @@ def load_midi(midi_path: str | Path) -> pretty_midi.PrettyMIDI:
         raise FileNotFoundError(f"MIDI file not found: {path}")
 
     try:
-        midi_data = pretty_midi.PrettyMIDI(str(path))
+        score = symusic.Score(str(path))
     except Exception as exc:
         raise ValueError(f"Failed to parse MIDI file '{path.name}': {exc}") from exc
 
-    return midi_data
+    return score
 
 
-def extract_notes(midi_data: pretty_midi.PrettyMIDI) -> list[dict[str, Any]]:
-    """Extract all NOTE_ON events from every instrument.
+def _ticks_to_seconds(score: symusic.Score, ticks: np.ndarray) -> np.ndarray:
+    """Convert absolute MIDI ticks to seconds using the score's tempo map.
 
-    Notes are sorted **deterministically** by ``(start, pitch)`` so downstream
-    processing always sees the same ordering.
+    symusic's own ``"second"`` conversion stores times as float32, which
+    is too coarse for onsets rounded to microseconds, so the map is
+    applied here in float64.  It follows the same tempo rules as
+    *pretty_midi* (120 BPM default, a tick-0 tempo replaces the default,
+    repeated tempi are ignored) so timings are unchanged by the switch.
 
     Args:
-        midi_data: A loaded ``PrettyMIDI`` object.
+        score: A tick-resolution score (provides ``tpq`` and ``tempos``).
+        ticks: Integer tick positions.
 
     Returns:
-        A list of dicts, each containing:
-            - ``pitch``    (int):   MIDI note number 0-127
-            - ``start``    (float): onset time in seconds
-            - ``end``      (float): offset time in seconds
-            - ``duration`` (float): note length in seconds
-            - ``velocity`` (int):   MIDI velocity 0-127
+        ``float64`` times in seconds, same shape as *ticks*.
     """
-    notes: list[dict[str, Any]] = []
-
-    for instrument in midi_data.instruments:
-        if instrument.is_drum:
-            continue  # skip percussion tracks
-        for note in instrument.notes:
-            notes.append(
-                {
-                    "pitch": note.pitch,
-                    "start": round(note.start, 6),
-                    "end": round(note.end, 6),
-                    "duration": round(note.end - note.start, 6),
-                    "velocity": note.velocity,
-                }
-            )
-
-    # Deterministic sort: onset time first, then pitch (ascending)
-    notes.sort(key=lambda n: (n["start"], n["pitch"]))
-    return notes
+    tpq = score.ticks_per_quarter
+    scale_ticks: list[int] = [0]
+    scales: list[float] = [60.0 / (120.0 * tpq)]
+    for tempo in sorted(score.tempos, key=lambda t: t.time):
+        tick_scale = 60.0 / ((6e7 / tempo.mspq) * tpq)
+        if tempo.time == 0:
+            scales = [tick_scale]
+        elif tick_scale != scales[-1]:
+            scale_ticks.append(tempo.time)
+            scales.append(tick_scale)
+
+    # Seconds elapsed at the start of each constant-tempo segment
+    seg_ticks = np.asarray(scale_ticks, dtype=np.int64)
+    seg_scales = np.asarray(scales, dtype=np.float64)
+    seg_starts = np.zeros(len(scales), dtype=np.float64)
+    for k in range(1, len(scales)):
+        seg_starts[k] = seg_starts[k - 1] + seg_scales[k - 1] * (seg_ticks[k] - seg_ticks[k - 1])
+
+    seg = np.searchsorted(seg_ticks, ticks, side="right") - 1
+    return seg_starts[seg] + seg_scales[seg] * (ticks - seg_ticks[seg])
+
+
+def extract_notes(score: symusic.Score) -> NoteArrays:
+    """Extract all NOTE_ON events from every non-drum track.
+
+    Notes are sorted **deterministically** by ``(start, pitch)`` so downstream
+    processing always sees the same ordering.
 
+    Args:
+        score: A tick-resolution ``symusic.Score`` (see :func:`load_midi`).
 
-def parse_midi(midi_path: str | Path) -> list[dict[str, Any]]:
+    Returns:
+        A dict of equal-length arrays, one entry per note:
+            - ``pitch``    (int16):   MIDI note number 0-127
+            - ``start``    (float64): onset time in seconds
+            - ``end``      (float64): offset time in seconds
+            - ``duration`` (float64): note length in seconds
+            - ``velocity`` (uint8):   MIDI velocity 0-127
+    """
+    columns = [
+        track.notes.numpy()
+        for track in score.tracks
+        if not track.is_drum  # skip percussion tracks
+    ]
+
+    def _column(key: str, dtype: type) -> np.ndarray:
+        return np.concatenate(
+            [np.asarray(col[key], dtype=dtype) for col in columns]
+            + [np.empty(0, dtype=dtype)]
+        )
+
+    pitch = _column("pitch", np.int16)
+    start_tick = _column("time", np.int64)
+    velocity = _column("velocity", np.uint8)
+    start = _ticks_to_seconds(score, start_tick)
+    end = _ticks_to_seconds(score, start_tick + _column("duration", np.int64))
+
+    # Duration comes from the unrounded times; then round all in place
+    duration = np.subtract(end, start)
+    for column in (start, end, duration):
+        np.round(column, 6, out=column)
+
+    # Deterministic sort: onset time first, then pitch (ascending).
+    # lexsort is stable and uses its *last* key as the primary key.
+    order = np.lexsort((pitch, start))
+    return {
+        "pitch": pitch[order],
+        "start": start[order],
+        "end": end[order],
+        "duration": duration[order],
+        "velocity": velocity[order],
+    }
+
+
+def parse_midi(midi_path: str | Path) -> NoteArrays:
     """Convenience wrapper: load MIDI → extract notes.
 
     Args:
         midi_path: Path to the MIDI file.
 
     Returns:
-        Sorted list of note dictionaries.
+        Sorted note columns (see :func:`extract_notes`).
     """
     midi_data = load_midi(midi_path)
     return extract_notes(midi_data)
+
+
+def parse_midi_cached(
+    midi_path: str | Path,
+    cache_dir: str | Path | None = None,
+) -> NoteArrays:
+    """Like :func:`parse_midi`, but reuse previously extracted notes.
+
+    The cache key is a BLAKE2b digest of the MIDI file's bytes and the
+    installed *symusic* version, so edited files or a parser upgrade
+    never hit a stale entry.  Entries are compressed ``.npz`` archives
+    of the note columns, readable by other users like any file the
+    project writes.  A cache that cannot be written (e.g. on a
+    read-only filesystem) is skipped silently.  Entries are never
+    evicted, so one-off inputs (such as web uploads) should use
+    :func:`parse_midi` instead.
+
+    Args:
+        midi_path: Path to the MIDI file.
+        cache_dir: Cache directory.
+            Defaults to ``.cache/midi/`` relative to the project root.
+
+    Returns:
+        Sorted note columns (see :func:`extract_notes`).
+
+    Raises:
+        FileNotFoundError: If *midi_path* does not exist.
+        ValueError: If the file cannot be parsed as MIDI.
+    """
+    path = Path(midi_path)
+    if not path.exists():
+        raise FileNotFoundError(f"MIDI file not found: {path}")
+
+    cache_dir = _DEFAULT_CACHE_DIR if cache_dir is None else Path(cache_dir)
+
+    digest = hashlib.blake2b(path.read_bytes(), digest_size=16)
+    digest.update(symusic.__version__.encode("utf-8"))
+    cache_path = cache_dir / f"{digest.hexdigest()}.npz"
+
+    if cache_path.exists():
+        try:
+            with np.load(cache_path) as cached:
+                return {key: cached[key] for key in cached.files}
+        except (OSError, ValueError):
+            pass  # unreadable entry — re-parse and overwrite
+
+    notes = parse_midi(path)
+
+    # Write to a temp file first so concurrent readers never see a
+    # partially written archive.
+    tmp_path: str | None = None
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=cache_dir, suffix=".npz", delete=False
+        ) as tmp:
+            tmp_path = tmp.name
+            np.savez_compressed(tmp, **notes)
+        # NamedTemporaryFile creates owner-only (0600) files
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if tmp_path is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+
+    return notes
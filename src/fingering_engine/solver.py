@@ -3,6 +3,14 @@
 State:  ``(note_index, hand, finger)``
 Transition: applies :class:`FingeringCostModel.total_cost` to evaluate
             every feasible (hand, finger) assignment for the next note.
+            The forward pass runs as a numba-compiled kernel
+            (:mod:`kernel`) when numba is installed; otherwise the
+            10×10 costs between two notes are gathered into one matrix
+            (memoised per interval and chord size) so each DP step is a
+            single vectorised min-reduction.
+            Costs are fixed-point ``int32`` (see ``COST_SCALE``); each DP
+            row is re-based on its minimum, which leaves every comparison
+            unchanged but keeps the sums bounded on long pieces.
 Output: the minimum-cost deterministic fingering path.
 
 Design choices:
@@ -16,11 +24,14 @@ Design choices:
 
 from __future__ import annotations
 
-import math
+import functools
 from pathlib import Path
 from typing import Any
 
-from .cost_model import FingeringCostModel
+import numpy as np
+
+from . import kernel
+from .cost_model import COST_SCALE, FingeringCostModel
 
 
 # ── Public types ──────────────────────────────────────────────
@@ -30,19 +41,133 @@ FINGERS: list[int] = [1, 2, 3, 4, 5]
 # State key: (hand, finger) tuple
 StateKey = tuple[str, int]
 
+# States are packed into a flat index: HAND_OFFSET[hand] + (finger - 1)
+HAND_OFFSET: dict[str, int] = {"L": 0, "R": 5}
+NUM_STATES: int = len(HANDS) * len(FINGERS)
+
+# Cost assigned to states that can never lie on the optimal path.
+# Large enough to lose every comparison, small enough that adding a
+# transition cost cannot overflow int32.
+_UNREACHABLE: int = 2**30
+
+
+def _state_index(hand: str, finger: int) -> int:
+    """Map a ``(hand, finger)`` state to its flat DP column index."""
+    return HAND_OFFSET[hand] + (finger - 1)
+
+
+def _state_key(state: int) -> StateKey:
+    """Map a flat DP column index back to its ``(hand, finger)`` state."""
+    hand_idx, finger_idx = divmod(state, len(FINGERS))
+    return HANDS[hand_idx], FINGERS[finger_idx]
+
+
+def _build_trans_matrix(
+    cost_model: FingeringCostModel,
+    delta_pitch: int,
+    chord_size: int,
+) -> np.ndarray:
+    """Build the 10×10 transition-cost matrix between two consecutive notes.
+
+    Every cost component depends on the interval between the notes
+    (its sign and magnitude), never on their absolute pitches, so the
+    matrix is keyed on ``delta_pitch`` and can be shared by every note
+    pair with the same interval and chord size.
+
+    Args:
+        cost_model: The cost model supplying the transition costs.
+        delta_pitch: Signed interval ``pitch_b - pitch_a`` in semitones.
+        chord_size: Number of simultaneous notes at the current onset.
+
+    Returns:
+        A read-only ``int32`` array where ``trans[a, b]`` is the fixed-point
+        cost of moving from state ``a`` (previous note) to state ``b``
+        (current note).
+    """
+    total_cost = cost_model.total_cost_int
+    trans = np.empty((NUM_STATES, NUM_STATES), dtype=np.int32)
+    for hand_a in HANDS:
+        for finger_a in FINGERS:
+            a = _state_index(hand_a, finger_a)
+            for hand_b in HANDS:
+                for finger_b in FINGERS:
+                    trans[a, _state_index(hand_b, finger_b)] = total_cost(
+                        finger_a, finger_b, 0, delta_pitch, hand_a, hand_b, chord_size
+                    )
+    trans.flags.writeable = False
+    return trans
+
+
+def _weight_vector(cost_model: FingeringCostModel) -> np.ndarray:
+    """Pack the quantised cost-model weights in :mod:`kernel` order."""
+    weights = np.empty(6, dtype=np.int64)
+    weights[kernel.W_STRETCH] = cost_model._sw_q
+    weights[kernel.W_CROSSING] = cost_model._cw_q
+    weights[kernel.W_REPETITION] = cost_model._rw_q
+    weights[kernel.W_HAND_SWITCH] = cost_model._hsw_q
+    weights[kernel.W_CHORD_PENALTY] = cost_model._cpw_q
+    weights[kernel.W_WEAK_FINGER] = cost_model._wfw_q
+    return weights
+
+
+def _forward_numpy(
+    cost_model: FingeringCostModel,
+    pitches: np.ndarray,
+    chord_sizes: np.ndarray,
+    dp0: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorised NumPy forward pass (used when numba is unavailable).
+
+    Returns:
+        ``(dp, bp)`` with the same layout as :func:`kernel.forward`.
+    """
+    n = len(pitches)
+
+    # dp[i, s] = minimum cumulative cost up to note i in state s
+    # bp[i, s] = predecessor state at note i-1
+    dp = np.empty((n, NUM_STATES), dtype=np.int32)
+    bp = np.empty((n, NUM_STATES), dtype=np.int8)
+    dp[0] = dp0
+    bp[0] = -1
+
+    # Transition matrices recur for every repeated (interval, chord size)
+    trans_for = functools.lru_cache(maxsize=4096)(
+        functools.partial(_build_trans_matrix, cost_model)
+    )
+
+    deltas = np.diff(pitches.astype(np.int64)).tolist()
+    sizes = chord_sizes.tolist()
+    for i in range(1, n):
+        trans = trans_for(deltas[i - 1], sizes[i])
+
+        # cand[a, b] = cost of reaching state b at note i via state a
+        cand = dp[i - 1][:, None] + trans
+        best = cand.min(axis=0)
+        bp[i] = cand.argmin(axis=0)
+
+        # Re-base on the row minimum so cumulative costs never overflow
+        dp[i] = best - best.min()
+
+    return dp, bp
+
 
 def solve(
     notes: list[dict[str, Any]],
     config_path: str | Path | None = None,
+    config: dict[str, Any] | None = None,
 ) -> list[dict[str, Any]]:
     """Find the optimal fingering for a sequence of notes via DP.
 
+    Wraps :func:`solve_states` and decodes its path into annotation dicts.
+
     Args:
         notes: Sorted list of note dicts (must contain at least
             ``pitch``, ``start``, ``chord_size``).
             Typically the output of :func:`feature_builder.build_features`.
         config_path: Optional path to ``fingering_costs.yaml``.
             Defaults to the project-relative config.
+        config: Optional already-parsed config dict; used instead of
+            *config_path* when given.
 
     Returns:
         A list of dicts (same length as *notes*), each containing:
@@ -51,95 +176,93 @@ def solve(
             - ``hand``       (``"L"`` | ``"R"``)
             - ``finger``     (1–5)
     """
+    states = solve_states(notes, config_path=config_path, config=config)
+
+    # ── Build result ──────────────────────────────────────────
+    path: list[StateKey] = [_state_key(state) for state in states.tolist()]
+    result: list[dict[str, Any]] = []
+    for note, (hand, finger) in zip(notes, path):
+        result.append(
+            {
+                "onset_time": note["start"],
+                "pitch": note["pitch"],
+                "hand": hand,
+                "finger": finger,
+            }
+        )
+
+    return result
+
+
+def solve_states(
+    notes: list[dict[str, Any]],
+    config_path: str | Path | None = None,
+    config: dict[str, Any] | None = None,
+) -> np.ndarray:
+    """Run the DP and return the optimal path as flat state indices.
+
+    Array-level counterpart of :func:`solve` for callers that score the
+    path numerically (e.g. the trainer) and never need per-note dicts.
+
+    Args:
+        notes: Sorted list of note dicts (see :func:`solve`).
+        config_path: Optional path to ``fingering_costs.yaml``.
+        config: Optional already-parsed config dict.
+
+    Returns:
+        ``int8`` array (same length as *notes*) of states
+        ``hand_index * 5 + (finger - 1)``, with hands ordered as
+        :data:`HANDS`.
+    """
     if not notes:
-        return []
+        return np.empty(0, dtype=np.int8)
 
-    cost_model = FingeringCostModel(config_path)
+    cost_model = FingeringCostModel(config_path, config=config)
     n = len(notes)
 
-    # ── DP tables ─────────────────────────────────────────────
-    # dp[i][(hand, finger)] = minimum cumulative cost up to note i
-    # bp[i][(hand, finger)] = predecessor state at note i-1
-    dp: list[dict[StateKey, float]] = [{} for _ in range(n)]
-    bp: list[dict[StateKey, StateKey | None]] = [{} for _ in range(n)]
+    pitches = np.fromiter((note["pitch"] for note in notes), dtype=np.int16, count=n)
+    chord_sizes = np.fromiter(
+        (note.get("chord_size", 1) for note in notes), dtype=np.int16, count=n
+    )
 
     # ── Initialise first note ─────────────────────────────────
     first_pitch: int = notes[0]["pitch"]
     preferred_hand: str = "L" if first_pitch <= cost_model.split_pitch else "R"
 
-    for hand in HANDS:
-        for finger in FINGERS:
-            # Small bias toward the "natural" hand
-            bias: float = 0.0 if hand == preferred_hand else cost_model.hand_switch_weight * 0.5
-            init_cost = cost_model.weak_finger_cost(finger) + bias
-            dp[0][(hand, finger)] = init_cost
-            bp[0][(hand, finger)] = None
+    # Weak-finger cost for each state, plus a small bias toward the
+    # "natural" hand on the other hand's five states
+    weak = np.array([cost_model.weak_finger_cost(f) for f in FINGERS] * len(HANDS))
+    bias = np.full(NUM_STATES, cost_model.hand_switch_weight * 0.5)
+    offset = HAND_OFFSET[preferred_hand]
+    bias[offset:offset + len(FINGERS)] = 0.0
+    dp0 = np.rint((weak + bias) * COST_SCALE).astype(np.int32)
+
+    # Drop first-note states that cannot win at note 1.  With
+    # gap = max_b(trans[best, b] - min_a trans[a, b]), any state costing
+    # more than dp0[best] + gap loses to ``best`` for every successor,
+    # so excluding it leaves the optimal path unchanged while giving
+    # the kernel's dominance pruning a tighter bound from the start.
+    if n > 1:
+        trans = _build_trans_matrix(
+            cost_model, int(pitches[1]) - int(pitches[0]), int(chord_sizes[1])
+        )
+        best = int(dp0.argmin())
+        gap = int((trans[best] - trans.min(axis=0)).max())
+        dp0[dp0 > dp0[best] + gap] = _UNREACHABLE
 
     # ── Forward pass ──────────────────────────────────────────
-    for i in range(1, n):
-        cur_note = notes[i]
-        prev_note = notes[i - 1]
-        chord_size: int = cur_note.get("chord_size", 1)
-
-        for hand_b in HANDS:
-            for finger_b in FINGERS:
-                best_cost: float = math.inf
-                best_prev: StateKey | None = None
-
-                for hand_a in HANDS:
-                    for finger_a in FINGERS:
-                        prev_cost = dp[i - 1].get((hand_a, finger_a))
-                        if prev_cost is None:
-                            continue
-
-                        trans = cost_model.total_cost(
-                            finger_a=finger_a,
-                            finger_b=finger_b,
-                            pitch_a=prev_note["pitch"],
-                            pitch_b=cur_note["pitch"],
-                            hand_a=hand_a,
-                            hand_b=hand_b,
-                            chord_size=chord_size,
-                        )
-                        total = prev_cost + trans
-                        if total < best_cost:
-                            best_cost = total
-                            best_prev = (hand_a, finger_a)
-
-                dp[i][(hand_b, finger_b)] = best_cost
-                bp[i][(hand_b, finger_b)] = best_prev
+    if kernel.HAVE_NUMBA:
+        dp, bp = kernel.forward(
+            pitches, chord_sizes, _weight_vector(cost_model), cost_model._span, dp0
+        )
+    else:
+        dp, bp = _forward_numpy(cost_model, pitches, chord_sizes, dp0)
 
     # ── Backtrack ─────────────────────────────────────────────
-    # Find best final state
-    best_final_cost: float = math.inf
-    best_final_state: StateKey = ("R", 1)
-    for state, cost in dp[n - 1].items():
-        if cost < best_final_cost:
-            best_final_cost = cost
-            best_final_state = state
-
-    # Trace path
-    path: list[StateKey] = [best_final_state]
+    # argmin returns the first minimum, matching the DP's tie-breaking
+    states = np.empty(n, dtype=np.int8)
+    states[n - 1] = dp[n - 1].argmin()
     for i in range(n - 1, 0, -1):
-        prev_state = bp[i][path[-1]]
-        if prev_state is None:
-            # Should not happen after index 0
-            prev_state = ("R", 1)
-        path.append(prev_state)
-
-    path.reverse()
+        states[i - 1] = bp[i, states[i]]
 
-    # ── Build result ──────────────────────────────────────────
-    result: list[dict[str, Any]] = []
-    for i, note in enumerate(notes):
-        hand, finger = path[i]
-        result.append(
-            {
-                "onset_time": note["start"],
-                "pitch": note["pitch"],
-                "hand": hand,
-                "finger": finger,
-            }
-        )
-
-    return result
+    return states
@@ -4,4 +4,5 @@ Sub-package containing:
     dataset    – ground-truth annotation loading and validation
     evaluator  – scoring solver output vs expert annotations
     trainer    – coordinate-descent weight optimiser
+    types      – column-oriented NoteArray container shared by the above
 """
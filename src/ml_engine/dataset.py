@@ -12,78 +12,211 @@ Files must be named ``*_ground_truth.json`` and placed in the
 annotations directory (default ``data/annotations/``).
 Each ground-truth file is paired with a MIDI file of the same stem
 in ``data/raw/`` (e.g. ``sonata_ground_truth.json`` ↔ ``sonata.mid``).
+
+Loaded annotations are returned as a :class:`GroundTruth`, which keeps
+the validated dicts together with a column-oriented
+:class:`~src.ml_engine.types.NoteArray` for fast vectorised scoring.
 """
 
 from __future__ import annotations
 
+import functools
 import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
+from .types import NoteArray
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib
+    orjson = None
+
 
 # ── Validation constants ──────────────────────────────────────
-_VALID_HANDS: set[str] = {"L", "R"}
 _VALID_FINGERS: set[int] = {1, 2, 3, 4, 5}
 
+# Accepted spellings in ground-truth files → (canonical hand, code)
+_HAND_MAP: dict[str, tuple[str, int]] = {
+    "L": ("L", 0), "R": ("R", 1), "l": ("L", 0), "r": ("R", 1),
+}
+
+
+@dataclass(frozen=True)
+class GroundTruth:
+    """Validated ground-truth annotations for one piece.
+
+    Instances are cached and shared by :func:`load_ground_truth`, so
+    they are immutable: the fields cannot be reassigned, ``records`` is
+    a tuple and the note arrays are read-only.  Treat the record dicts
+    as read-only too.
+
+    Attributes:
+        records: Annotation dicts (``onset_time``, ``pitch``, ``hand``,
+            ``finger``), in file order.
+        notes: The same annotations as a :class:`NoteArray`.
+    """
+
+    records: tuple[dict[str, Any], ...]
+    notes: NoteArray
+
+    def __len__(self) -> int:
+        return len(self.records)
 
-def load_ground_truth(json_path: str | Path) -> list[dict[str, Any]]:
+
+def load_ground_truth(json_path: str | Path) -> GroundTruth:
     """Load and validate a single ground-truth annotation file.
 
+    Results are cached on the resolved path and modification time, so
+    repeated loads of an unchanged file return the same shared
+    (immutable) instance.
+
     Args:
         json_path: Path to a ``*_ground_truth.json`` file.
 
     Returns:
-        List of validated annotation dicts, each containing:
-            ``onset_time`` (float), ``pitch`` (int),
-            ``hand`` (str), ``finger`` (int).
+        A :class:`GroundTruth` whose ``records`` are validated dicts, each
+        containing ``onset_time`` (float), ``pitch`` (int),
+        ``hand`` (str), ``finger`` (int).
 
     Raises:
         FileNotFoundError: If the file does not exist.
         ValueError: If any annotation entry fails validation.
     """
     path = Path(json_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Ground-truth file not found: {path}")
+    # One stat both checks existence and keys the cache
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Ground-truth file not found: {path}") from None
+
+    return _load_ground_truth_cached(path, str(path.resolve()), mtime_ns)
 
-    with open(path, "r", encoding="utf-8") as fh:
-        data = json.load(fh)
+
+@functools.lru_cache(maxsize=128)
+def _load_ground_truth_cached(
+    path: Path, resolved: str, mtime_ns: int
+) -> GroundTruth:
+    """Parse and validate *path*; cached on ``(path, resolved, mtime)``.
+
+    *path* is kept as given so error messages match the caller's
+    spelling; *resolved* and *mtime_ns* make the entry specific to one
+    version of one file.
+    """
+    try:
+        raw = path.read_bytes()
+    except FileNotFoundError:  # deleted since the stat
+        raise FileNotFoundError(f"Ground-truth file not found: {path}") from None
+    data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
     if not isinstance(data, list):
         raise ValueError(
             f"Ground-truth file must contain a JSON array, got {type(data).__name__}: {path}"
         )
 
+    n = len(data)
     validated: list[dict[str, Any]] = []
+    onsets = np.empty(n, dtype=np.float64)
+    pitches = np.empty(n, dtype=np.int16)
+    hands = np.empty(n, dtype=np.int8)
+    fingers = np.empty(n, dtype=np.int8)
     for i, entry in enumerate(data):
-        # ── Required keys ─────────────────────────────────────
-        for key in ("onset_time", "pitch", "hand", "finger"):
-            if key not in entry:
-                raise ValueError(
-                    f"Entry {i} in '{path.name}' is missing required key '{key}'"
-                )
-
-        hand = str(entry["hand"]).upper()
-        finger = int(entry["finger"])
-
-        if hand not in _VALID_HANDS:
+        # ── Required keys (first missing one is reported) ─────
+        if not isinstance(entry, dict):  # a non-object has none of them
             raise ValueError(
-                f"Entry {i} in '{path.name}': hand must be 'L' or 'R', got '{hand}'"
+                f"Entry {i} in '{path.name}' is missing required key 'onset_time'"
             )
+        try:
+            onset_time = entry["onset_time"]
+            pitch = entry["pitch"]
+            raw_hand = entry["hand"]
+            finger = int(entry["finger"])
+        except KeyError as exc:
+            raise ValueError(
+                f"Entry {i} in '{path.name}' is missing required key '{exc.args[0]}'"
+            ) from None
+
+        try:
+            hand, hands[i] = _HAND_MAP[raw_hand]
+        except (KeyError, TypeError):
+            raise ValueError(
+                f"Entry {i} in '{path.name}': hand must be 'L' or 'R', "
+                f"got '{str(raw_hand).upper()}'"
+            ) from None
         if finger not in _VALID_FINGERS:
             raise ValueError(
                 f"Entry {i} in '{path.name}': finger must be 1–5, got {finger}"
             )
+        fingers[i] = finger
+
+        onset_time = float(onset_time)
+        pitch = int(pitch)
+        onsets[i] = onset_time
+        pitches[i] = pitch
 
         validated.append(
             {
-                "onset_time": float(entry["onset_time"]),
-                "pitch": int(entry["pitch"]),
+                "onset_time": onset_time,
+                "pitch": pitch,
                 "hand": hand,
                 "finger": finger,
             }
         )
 
-    return validated
+    notes = NoteArray(onset_time=onsets, pitch=pitches, hand=hands, finger=fingers)
+    for column in (onsets, pitches, hands, fingers):
+        column.flags.writeable = False
+    return GroundTruth(records=tuple(validated), notes=notes)
+
+
+@functools.lru_cache(maxsize=4)
+def _scan_training_files(
+    annotations_dir: str,
+    raw_dir: str,
+    annotations_mtime_ns: int,
+    raw_mtime_ns: int,
+) -> tuple[tuple[str, str, str | None], ...]:
+    """Pair ground-truth files with MIDI files by name, cached per directory state.
+
+    Adding, removing or renaming a file updates its directory's
+    modification time, which is part of the cache key, so repeated
+    loads skip the glob and ``exists()`` probes until either directory
+    changes.  File *contents* are not cached here.
+
+    The raw directory is listed once with :func:`os.scandir` and MIDI
+    files are matched by stem from that index, instead of probing two
+    candidate names per ground-truth file.
+
+    Args:
+        annotations_dir: Resolved annotations directory.
+        raw_dir: Resolved raw MIDI directory.
+        annotations_mtime_ns: ``st_mtime_ns`` of *annotations_dir*.
+        raw_mtime_ns: ``st_mtime_ns`` of *raw_dir*.
+
+    Returns:
+        ``(stem, ground_truth_name, midi_name)`` per ground-truth file in
+        sorted order; ``midi_name`` is ``None`` when no MIDI matches.
+    """
+    # Index MIDI files by stem; ``.mid`` wins over ``.midi``
+    midi_index: dict[str, str] = {}
+    with os.scandir(raw_dir) as it:
+        for entry in it:
+            stem, ext = os.path.splitext(entry.name)
+            if ext == ".mid" or (ext == ".midi" and stem not in midi_index):
+                midi_index[stem] = entry.name
+
+    entries: list[tuple[str, str, str | None]] = []
+    for gt_path in sorted(Path(annotations_dir).glob("*_ground_truth.json")):
+        # Derive stem: "sonata_ground_truth.json" → "sonata"
+        stem = gt_path.name.replace("_ground_truth.json", "")
+        entries.append((stem, gt_path.name, midi_index.get(stem)))
+
+    return tuple(entries)
 
 
 def load_training_set(
@@ -104,7 +237,7 @@ def load_training_set(
     Returns:
         A list of dicts, each with:
             - ``midi_path``       (Path): absolute path to the MIDI file
-            - ``ground_truth``    (list): validated annotation list
+            - ``ground_truth``    (GroundTruth): validated annotations
             - ``stem``            (str):  base filename stem
 
     Raises:
@@ -128,40 +261,39 @@ def load_training_set(
     if not raw_dir.is_dir():
         raise FileNotFoundError(f"Raw MIDI directory not found: {raw_dir}")
 
-    # Discover ground-truth files
-    gt_files = sorted(annotations_dir.glob("*_ground_truth.json"))
-    if not gt_files:
+    # Discover ground-truth files and their MIDI partners
+    entries = _scan_training_files(
+        str(annotations_dir.resolve()),
+        str(raw_dir.resolve()),
+        annotations_dir.stat().st_mtime_ns,
+        raw_dir.stat().st_mtime_ns,
+    )
+    if not entries:
         raise FileNotFoundError(
             f"No *_ground_truth.json files found in: {annotations_dir}"
         )
 
     pairs: list[dict[str, Any]] = []
-    for gt_path in gt_files:
-        # Derive stem: "sonata_ground_truth.json" → "sonata"
-        stem = gt_path.name.replace("_ground_truth.json", "")
+    # Read files on a few threads so disk I/O overlaps; results and
+    # errors are still consumed in file order.
+    with ThreadPoolExecutor(max_workers=min(8, len(entries))) as pool:
+        futures = [
+            pool.submit(load_ground_truth, annotations_dir / gt_name)
+            for _, gt_name, _ in entries
+        ]
+        for (stem, gt_name, midi_name), future in zip(entries, futures):
+            if midi_name is None:
+                raise FileNotFoundError(
+                    f"No matching MIDI file for '{gt_name}' "
+                    f"in {raw_dir} (tried {stem}.mid / {stem}.midi)"
+                )
 
-        # Find matching MIDI (try .mid and .midi)
-        midi_path: Path | None = None
-        for ext in (".mid", ".midi"):
-            candidate = raw_dir / f"{stem}{ext}"
-            if candidate.exists():
-                midi_path = candidate
-                break
-
-        if midi_path is None:
-            raise FileNotFoundError(
-                f"No matching MIDI file for '{gt_path.name}' "
-                f"in {raw_dir} (tried {stem}.mid / {stem}.midi)"
+            pairs.append(
+                {
+                    "midi_path": raw_dir / midi_name,
+                    "ground_truth": future.result(),
+                    "stem": stem,
+                }
             )
 
-        ground_truth = load_ground_truth(gt_path)
-
-        pairs.append(
-            {
-                "midi_path": midi_path,
-                "ground_truth": ground_truth,
-                "stem": stem,
-            }
-        )
-
     return pairs
@@ -5,8 +5,16 @@ Provides three granularity levels:
     - ``hand_accuracy``   : only the hand assignment is checked
     - ``finger_accuracy`` : finger checked only where the hand is correct
 
+``accuracy_triple`` computes all three at once from encoded arrays;
+the single-metric functions are thin wrappers around it.
+
+Inputs are scored as :class:`~src.ml_engine.types.NoteArray` columns;
+lists of annotation dicts are converted on entry.
+
 Plus a convenience function ``evaluate_config`` that runs the full
-feature → solver pipeline with a given YAML config and returns all metrics.
+feature → solver pipeline with a given config (YAML path or dict) and
+returns all metrics, and ``evaluate_predictions`` which scores
+already-solved output the same way.
 """
 
 from __future__ import annotations
@@ -14,16 +22,84 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
+from .dataset import GroundTruth
+from .types import NoteArray
+
+
+# Anything the metrics accept: arrays, loaded ground truth, or dicts
+Annotations = NoteArray | GroundTruth | list[dict[str, Any]]
+
+
+def _as_note_array(notes: Annotations) -> NoteArray:
+    """Return *notes* as a :class:`NoteArray`, converting dicts if needed."""
+    if isinstance(notes, NoteArray):
+        return notes
+    if isinstance(notes, GroundTruth):
+        return notes.notes
+    return NoteArray.from_dicts(notes)
+
+
+def accuracy_triple(
+    pred_h: np.ndarray,
+    pred_f: np.ndarray,
+    gt_h: np.ndarray,
+    gt_f: np.ndarray,
+) -> tuple[float, float, float]:
+    """Compute note, hand and finger accuracy in one pass over the arrays.
+
+    Args:
+        pred_h: Predicted hands (``int8``, ``L`` → 0, ``R`` → 1).
+        pred_f: Predicted fingers (``int8``).
+        gt_h: Ground-truth hands, same length and encoding.
+        gt_f: Ground-truth fingers, same length.
+
+    Returns:
+        ``(note_accuracy, hand_accuracy, finger_accuracy)``, each a
+        Python ``float`` (not a NumPy scalar) in [0.0, 1.0].  All three
+        are 0.0 on empty input; finger accuracy is 0.0 when no hand is
+        correct.
+    """
+    n = len(gt_h)
+    if n == 0:
+        return 0.0, 0.0, 0.0
+
+    hand_mask = pred_h == gt_h
+    finger_mask = pred_f == gt_f
+
+    hand_correct = np.count_nonzero(hand_mask)
+    note_correct = np.count_nonzero(hand_mask & finger_mask)
+    finger = note_correct / hand_correct if hand_correct else 0.0
+    return float(note_correct / n), float(hand_correct / n), float(finger)
+
+
+def _note_accuracy_fast(pred: NoteArray, gt: NoteArray) -> float:
+    """Note accuracy over the shared prefix of two :class:`NoteArray` s.
+
+    The trainer's inner loop: no type dispatch, no length checks and
+    no hand / finger metrics — just the one vector comparison.  Equal
+    to ``evaluate_predictions(pred, gt)["note_accuracy"]``.
+    """
+    n = min(len(pred), len(gt))
+    if n == 0:
+        return 0.0
+    correct = np.count_nonzero(
+        (pred.hand[:n] == gt.hand[:n]) & (pred.finger[:n] == gt.finger[:n])
+    )
+    return float(correct / n)
+
 
 def note_accuracy(
-    predicted: list[dict[str, Any]],
-    ground_truth: list[dict[str, Any]],
+    predicted: Annotations,
+    ground_truth: Annotations,
 ) -> float:
     """Fraction of notes where *both* hand and finger match.
 
     Args:
-        predicted: Solver output (list of annotation dicts).
-        ground_truth: Expert annotations (same schema).
+        predicted: Solver output (:class:`NoteArray` or annotation dicts).
+        ground_truth: Expert annotations (:class:`NoteArray`,
+            :class:`GroundTruth` or annotation dicts).
 
     Returns:
         Accuracy in [0.0, 1.0]. Returns 0.0 on empty input.
@@ -39,17 +115,13 @@ def note_accuracy(
             f"ground_truth={len(ground_truth)}"
         )
 
-    correct = sum(
-        1
-        for p, g in zip(predicted, ground_truth)
-        if p["hand"] == g["hand"] and p["finger"] == g["finger"]
-    )
-    return correct / len(ground_truth)
+    pred, gt = _as_note_array(predicted), _as_note_array(ground_truth)
+    return accuracy_triple(pred.hand, pred.finger, gt.hand, gt.finger)[0]
 
 
 def hand_accuracy(
-    predicted: list[dict[str, Any]],
-    ground_truth: list[dict[str, Any]],
+    predicted: Annotations,
+    ground_truth: Annotations,
 ) -> float:
     """Fraction of notes where the hand assignment is correct.
 
@@ -68,15 +140,13 @@ def hand_accuracy(
             f"ground_truth={len(ground_truth)}"
         )
 
-    correct = sum(
-        1 for p, g in zip(predicted, ground_truth) if p["hand"] == g["hand"]
-    )
-    return correct / len(ground_truth)
+    pred, gt = _as_note_array(predicted), _as_note_array(ground_truth)
+    return accuracy_triple(pred.hand, pred.finger, gt.hand, gt.finger)[1]
 
 
 def finger_accuracy(
-    predicted: list[dict[str, Any]],
-    ground_truth: list[dict[str, Any]],
+    predicted: Annotations,
+    ground_truth: Annotations,
 ) -> float:
     """Fraction of correct finger assignments *among notes with correct hand*.
 
@@ -99,35 +169,28 @@ def finger_accuracy(
             f"ground_truth={len(ground_truth)}"
         )
 
-    hand_correct_pairs = [
-        (p, g)
-        for p, g in zip(predicted, ground_truth)
-        if p["hand"] == g["hand"]
-    ]
-
-    if not hand_correct_pairs:
-        return 0.0
-
-    finger_correct = sum(
-        1 for p, g in hand_correct_pairs if p["finger"] == g["finger"]
-    )
-    return finger_correct / len(hand_correct_pairs)
+    pred, gt = _as_note_array(predicted), _as_note_array(ground_truth)
+    return accuracy_triple(pred.hand, pred.finger, gt.hand, gt.finger)[2]
 
 
 def evaluate_config(
     midi_path: str | Path,
-    ground_truth: list[dict[str, Any]],
-    config_path: str | Path,
+    ground_truth: Annotations,
+    config_path: str | Path | None = None,
+    config: dict[str, Any] | None = None,
 ) -> dict[str, float]:
-    """Run the full pipeline with a YAML config and score against ground truth.
+    """Run the full pipeline with a cost config and score against ground truth.
 
     This function imports the fingering engine lazily to avoid circular
     dependencies.
 
     Args:
         midi_path: Path to the source MIDI file.
-        ground_truth: Validated expert annotations (list of dicts).
+        ground_truth: Validated expert annotations — a :class:`GroundTruth`
+            from :func:`dataset.load_ground_truth`, or a list of dicts.
         config_path: Path to the cost-config YAML to evaluate.
+        config: Already-parsed config dict to evaluate instead of
+            *config_path* (avoids a YAML round-trip per trial).
 
     Returns:
         A dict with keys:
@@ -138,13 +201,29 @@ def evaluate_config(
     # Lazy import to keep engine and ml_engine loosely coupled
     from src.fingering_engine.midi_parser import load_midi, extract_notes
     from src.fingering_engine.feature_builder import build_features
-    from src.fingering_engine.solver import solve
+    from src.fingering_engine.solver import solve_states
 
     midi_data = load_midi(midi_path)
     notes = extract_notes(midi_data)
     features = build_features(notes)
-    predicted = solve(features, config_path=config_path)
+    states = solve_states(features, config_path=config_path, config=config)
+    return evaluate_predictions(NoteArray.from_states(features, states), ground_truth)
+
+
+def evaluate_predictions(
+    predicted: Annotations,
+    ground_truth: Annotations,
+) -> dict[str, float]:
+    """Score solver output against ground truth with all three metrics.
 
+    Args:
+        predicted: Solver output (:class:`NoteArray` or annotation dicts).
+        ground_truth: Validated expert annotations — a :class:`GroundTruth`,
+            :class:`NoteArray` or a list of dicts.
+
+    Returns:
+        The same metrics dict as :func:`evaluate_config`.
+    """
     # Align lengths — ground truth may be a subset (first N notes)
     # or same length. Truncate to the shorter list.
     min_len = min(len(predicted), len(ground_truth))
@@ -155,11 +234,12 @@ def evaluate_config(
             "finger_accuracy": 0.0,
         }
 
-    pred_trimmed = predicted[:min_len]
-    gt_trimmed = ground_truth[:min_len]
+    pred = _as_note_array(predicted).head(min_len)
+    gt = _as_note_array(ground_truth).head(min_len)
 
+    note, hand, finger = accuracy_triple(pred.hand, pred.finger, gt.hand, gt.finger)
     return {
-        "note_accuracy": note_accuracy(pred_trimmed, gt_trimmed),
-        "hand_accuracy": hand_accuracy(pred_trimmed, gt_trimmed),
-        "finger_accuracy": finger_accuracy(pred_trimmed, gt_trimmed),
+        "note_accuracy": note,
+        "hand_accuracy": hand,
+        "finger_accuracy": finger,
     }
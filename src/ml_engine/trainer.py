@@ -12,24 +12,38 @@ Algorithm:
     4. Repeat for ``max_rounds`` (default 3) until convergence.
 
 Design:
-    - Deterministic, single-threaded, CPU-only.
+    - Deterministic, CPU-only; training pairs are scored in parallel
+      worker processes (results are combined in input order).
     - Numpy-only (no scipy required).
     - Frozen parameters: ``max_comfortable_span``, ``split_pitch``.
     - Learnable parameters: 6 scalar weights.
+    - Trial configs are passed to the solver in memory (no temp files).
     - Writes the optimised config to a new YAML file.
 """
 
 from __future__ import annotations
 
-import copy
-import tempfile
+import contextlib
+import functools
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 from pathlib import Path
 from typing import Any
 
 import numpy as np
 import yaml
 
-from .evaluator import evaluate_config
+try:
+    from yaml import CSafeDumper as _SafeDumper  # libyaml C backend
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper
+    from yaml import SafeLoader as _SafeLoader
+
+from .evaluator import _as_note_array, _note_accuracy_fast
+from .types import NoteArray
 
 
 # ── Learnable weight keys (order matters for reproducibility) ─
@@ -43,53 +57,151 @@ _WEIGHT_KEYS: list[str] = [
 ]
 
 # ── Candidate multipliers for coordinate descent ─────────────
-_MULTIPLIERS: list[float] = [0.25, 0.5, 0.75, 1.0, 1.25, 1.5, 2.0, 3.0]
+# Evaluated centre-out: small changes tend to score closest to the
+# current best, which lets later trials be abandoned early.
+_MULTIPLIERS: list[float] = [1.0, 1.25, 0.75, 1.5, 0.5, 2.0, 0.25, 3.0]
 
+# A training pair as scored: source MIDI path and ground-truth arrays
+ScoringPair = tuple[Path, NoteArray]
 
-def _write_temp_config(cfg: dict[str, Any]) -> Path:
-    """Write a config dict to a temporary YAML file and return its path.
 
-    The caller is responsible for cleanup (or relies on OS temp cleanup).
+def _weight_key(cfg: dict[str, Any]) -> tuple[float, ...]:
+    """Return the learnable weights of *cfg* as a hashable cache key.
 
     Args:
         cfg: Full cost-config dictionary.
 
     Returns:
-        Path to the temporary YAML file.
+        The :data:`_WEIGHT_KEYS` values, rounded to 6 decimals.
     """
-    tmp = tempfile.NamedTemporaryFile(
-        mode="w", suffix=".yaml", delete=False, encoding="utf-8"
-    )
-    yaml.dump(cfg, tmp, default_flow_style=False, allow_unicode=True)
-    tmp.close()
-    return Path(tmp.name)
+    return tuple(round(float(cfg[k]), 6) for k in _WEIGHT_KEYS)
 
 
-def _mean_accuracy(
-    training_pairs: list[dict[str, Any]],
-    config_path: Path,
-) -> float:
-    """Compute the mean note accuracy across all training pairs.
+@functools.lru_cache(maxsize=None)
+def _features_for(midi_path: Path) -> list[dict[str, Any]]:
+    """Parse a training MIDI file and build its solver features, once.
+
+    Features depend only on the MIDI file, not on the cost weights, so
+    every trial reuses the same list.  It is shared and must not be
+    mutated.
 
     Args:
-        training_pairs: Output of :func:`dataset.load_training_set`.
-        config_path: Path to the YAML config being evaluated.
+        midi_path: Path to the source MIDI file.
 
     Returns:
-        Mean note accuracy in [0.0, 1.0].
+        Feature dicts from :func:`feature_builder.build_features`.
     """
-    accuracies: list[float] = []
-    for pair in training_pairs:
-        metrics = evaluate_config(
-            midi_path=pair["midi_path"],
-            ground_truth=pair["ground_truth"],
-            config_path=config_path,
-        )
-        accuracies.append(metrics["note_accuracy"])
+    # Lazy import to keep engine and ml_engine loosely coupled
+    from src.fingering_engine.midi_parser import load_midi, extract_notes
+    from src.fingering_engine.feature_builder import build_features
+
+    return build_features(extract_notes(load_midi(midi_path)))
+
+
+def _score_pair(pair: ScoringPair, cfg: dict[str, Any]) -> float:
+    """Note accuracy of one training pair under *cfg*.
+
+    Worker processes call it through :func:`_score_worker_pair`; each
+    worker keeps its own :func:`_features_for` cache across trials.
+
+    Args:
+        pair: ``(midi_path, ground_truth)`` of one training example.
+        cfg: Full cost-config dictionary being evaluated.
+
+    Returns:
+        Note accuracy in [0.0, 1.0].
+    """
+    from src.fingering_engine.solver import solve_states
 
-    if not accuracies:
+    midi_path, ground_truth = pair
+    features = _features_for(midi_path)
+    predicted = NoteArray.from_states(features, solve_states(features, config=cfg))
+    return _note_accuracy_fast(predicted, ground_truth)
+
+
+# ── Worker processes ──────────────────────────────────────────
+# Training pairs installed once per worker by :func:`_init_worker`, so
+# each task only ships a pair index and the trial config.
+_worker_pairs: list[ScoringPair] = []
+
+
+def _init_worker(training_pairs: list[ScoringPair]) -> None:
+    """Store *training_pairs* for :func:`_score_worker_pair` in a worker.
+
+    Args:
+        training_pairs: Pairs to score, as built by :func:`train`.
+    """
+    global _worker_pairs
+    _worker_pairs = training_pairs
+
+
+def _score_worker_pair(index: int, cfg: dict[str, Any]) -> float:
+    """:func:`_score_pair` for the worker's *index*-th training pair."""
+    return _score_pair(_worker_pairs[index], cfg)
+
+
+def _submit_trial(
+    training_pairs: list[ScoringPair],
+    cfg: dict[str, Any],
+    pool: Executor | None = None,
+) -> tuple[list[Callable[[], float]], list[Future]]:
+    """Queue every training pair of one trial for scoring.
+
+    Args:
+        training_pairs: Pairs to score, as built by :func:`train`.
+        cfg: Full cost-config dictionary being evaluated.
+        pool: Executor to score pairs on, set up with
+            :func:`_init_worker` for the same *training_pairs*.  ``None``
+            defers scoring to the returned getters, in this process.
+
+    Returns:
+        ``(getters, futures)`` — one zero-argument score getter per
+        pair, in order, and the pool futures backing them (empty without
+        a pool) so an abandoned trial can be cancelled.
+    """
+    if pool is None:
+        getters = [functools.partial(_score_pair, pair, cfg) for pair in training_pairs]
+        return getters, []
+
+    futures = [
+        pool.submit(_score_worker_pair, index, cfg)
+        for index in range(len(training_pairs))
+    ]
+    return [f.result for f in futures], futures
+
+
+def _mean_accuracy(
+    getters: list[Callable[[], float]],
+    floor: float | None = None,
+) -> float | None:
+    """Collect per-pair scores and return their mean note accuracy.
+
+    With a *floor*, scoring stops as soon as the trial provably cannot
+    reach it — even if every remaining pair scored 1.0.
+
+    Args:
+        getters: Per-pair score getters from :func:`_submit_trial`.
+        floor: Accuracy the trial must at least match to be useful.
+
+    Returns:
+        Mean note accuracy in [0.0, 1.0], or ``None`` if abandoned.
+    """
+    total_pairs = len(getters)
+    if not total_pairs:
         return 0.0
-    return float(np.mean(accuracies))
+
+    scores: list[float] = []
+    running = 0.0
+    for done, get in enumerate(getters, start=1):
+        score = get()
+        scores.append(score)
+        running += score
+        # The margin keeps float error from ever pruning a tie
+        ceiling = (running + (total_pairs - done)) / total_pairs
+        if floor is not None and ceiling < floor - 1e-9:
+            return None
+
+    return float(np.mean(scores))
 
 
 def train(
@@ -98,6 +210,7 @@ def train(
     output_config_path: str | Path | None = None,
     max_rounds: int = 3,
     verbose: bool = True,
+    max_workers: int | None = None,
 ) -> dict[str, Any]:
     """Optimise cost weights via coordinate descent.
 
@@ -108,13 +221,19 @@ def train(
     Args:
         training_pairs: List of training dicts from
             :func:`dataset.load_training_set`. Each must have
-            ``midi_path`` (Path) and ``ground_truth`` (list).
+            ``midi_path`` (Path) and ``ground_truth``
+            (:class:`~src.ml_engine.dataset.GroundTruth` | list[dict]).
         base_config_path: Path to the baseline YAML config.
             Defaults to ``configs/fingering_costs.yaml``.
         output_config_path: Where to write the optimised YAML.
             Defaults to ``configs/fingering_costs_learned.yaml``.
         max_rounds: Number of full sweeps over all weights.
         verbose: If True, print progress to stdout.
+        max_workers: Worker processes used to score training pairs.
+            Defaults to ``os.cpu_count()``, capped at the number of
+            training pairs; ``1`` scores in-process.
+            Workers use the ``spawn`` start method, so scripts calling
+            :func:`train` need an ``if __name__ == "__main__":`` guard.
 
     Returns:
         A dict with:
@@ -152,71 +271,132 @@ def train(
 
     # ── Load baseline ─────────────────────────────────────────
     with open(base_config_path, "r", encoding="utf-8") as fh:
-        base_cfg: dict[str, Any] = yaml.safe_load(fh)
+        base_cfg: dict[str, Any] = yaml.load(fh, Loader=_SafeLoader)
+
+    # Ground truth as arrays, converted once for every trial
+    scoring_pairs: list[ScoringPair] = [
+        (Path(pair["midi_path"]), _as_note_array(pair["ground_truth"]))
+        for pair in training_pairs
+    ]
+
+    # More workers than pairs would only start idle processes
+    workers = min(max_workers or os.cpu_count() or 1, len(scoring_pairs))
+
+    # One pool for the whole run, so each worker's feature cache
+    # survives across trials and the training pairs are sent to each
+    # worker once.  Workers are spawned, not forked, so they behave
+    # the same on every platform and never inherit threads (such as
+    # the ground-truth loader's).  A single worker scores in-process.
+    if workers > 1:
+        executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=(scoring_pairs,),
+        )
+    else:
+        executor = contextlib.nullcontext()
 
-    # Score baseline
-    baseline_accuracy = _mean_accuracy(training_pairs, base_config_path)
-    if verbose:
-        print(f"Baseline note accuracy: {baseline_accuracy:.4f}")
+    with executor as pool:
+        # Score baseline
+        baseline_accuracy = _mean_accuracy(
+            _submit_trial(scoring_pairs, base_cfg, pool)[0]
+        )
+        if verbose:
+            print(f"Baseline note accuracy: {baseline_accuracy:.4f}")
 
-    # ── Coordinate descent ────────────────────────────────────
-    best_cfg = copy.deepcopy(base_cfg)
-    best_accuracy = baseline_accuracy
+        # Mean accuracy per weight vector already scored — coordinate
+        # descent revisits the same vectors across rounds.
+        accuracy_cache: dict[tuple[float, ...], float] = {
+            _weight_key(base_cfg): baseline_accuracy
+        }
 
-    for round_idx in range(max_rounds):
-        improved_this_round = False
+        # ── Coordinate descent ────────────────────────────────
+        # Only top-level scalar weights are ever replaced, so shallow
+        # copies suffice; nested tables (span limits) stay shared.
+        best_cfg = base_cfg.copy()
+        best_accuracy = baseline_accuracy
 
-        for key in _WEIGHT_KEYS:
-            original_value = float(best_cfg[key])
-            best_value_for_key = original_value
-            best_acc_for_key = best_accuracy
+        for round_idx in range(max_rounds):
+            improved_this_round = False
+
+            for key in _WEIGHT_KEYS:
+                original_value = float(best_cfg[key])
+                best_value_for_key = original_value
+                best_acc_for_key = best_accuracy
 
-            if verbose:
-                print(
-                    f"  Round {round_idx + 1}/{max_rounds} | "
-                    f"Tuning {key} (current={original_value:.3f})"
-                )
-
-            for mult in _MULTIPLIERS:
-                candidate_value = original_value * mult
-
-                # Skip zero or negative weights
-                if candidate_value <= 0:
-                    continue
-
-                # Build trial config
-                trial_cfg = copy.deepcopy(best_cfg)
-                trial_cfg[key] = round(candidate_value, 6)
-                trial_path = _write_temp_config(trial_cfg)
-
-                try:
-                    acc = _mean_accuracy(training_pairs, trial_path)
-                finally:
-                    # Clean up temp file
-                    trial_path.unlink(missing_ok=True)
-
-                if acc > best_acc_for_key:
-                    best_acc_for_key = acc
-                    best_value_for_key = candidate_value
-
-            # Update if improvement found
-            if best_value_for_key != original_value:
-                best_cfg[key] = round(best_value_for_key, 6)
-                best_accuracy = best_acc_for_key
-                improved_this_round = True
                 if verbose:
                     print(
-                        f"    → {key}: {original_value:.3f} → "
-                        f"{best_value_for_key:.3f} (acc={best_accuracy:.4f})"
+                        f"  Round {round_idx + 1}/{max_rounds} | "
+                        f"Tuning {key} (current={original_value:.3f})"
                     )
 
-        if verbose:
-            print(f"  Round {round_idx + 1} done — accuracy: {best_accuracy:.4f}")
+                # Queue every uncached trial of this axis up front so
+                # the pool stays busy across the whole sweep
+                trials: list[tuple[float, tuple[float, ...], list, list]] = []
+                for mult in _MULTIPLIERS:
+                    # The unchanged weight scores exactly best_accuracy
+                    if mult == 1.0:
+                        continue
+
+                    candidate_value = original_value * mult
+
+                    # Skip zero or negative weights
+                    if candidate_value <= 0:
+                        continue
+
+                    trial_cfg = best_cfg.copy()
+                    trial_cfg[key] = round(candidate_value, 6)
+
+                    cache_key = _weight_key(trial_cfg)
+                    if cache_key in accuracy_cache:
+                        getters, futures = [], []
+                    else:
+                        getters, futures = _submit_trial(
+                            scoring_pairs, trial_cfg, pool
+                        )
+                    trials.append((candidate_value, cache_key, getters, futures))
+
+                for candidate_value, cache_key, getters, futures in trials:
+                    acc = accuracy_cache.get(cache_key)
+                    if acc is None and getters:
+                        acc = _mean_accuracy(getters, floor=best_acc_for_key)
+                        if acc is None:
+                            # Cannot beat the best so far — drop the rest
+                            for future in futures:
+                                future.cancel()
+                            continue
+                        accuracy_cache[cache_key] = acc
+                    if acc is None:
+                        continue  # duplicate of an abandoned trial
+
+                    # Ties go to the smaller value, as in an ascending sweep
+                    if acc > best_acc_for_key or (
+                        acc == best_acc_for_key
+                        and best_value_for_key != original_value
+                        and candidate_value < best_value_for_key
+                    ):
+                        best_acc_for_key = acc
+                        best_value_for_key = candidate_value
+
+                # Update if improvement found
+                if best_value_for_key != original_value:
+                    best_cfg[key] = round(best_value_for_key, 6)
+                    best_accuracy = best_acc_for_key
+                    improved_this_round = True
+                    if verbose:
+                        print(
+                            f"    → {key}: {original_value:.3f} → "
+                            f"{best_value_for_key:.3f} (acc={best_accuracy:.4f})"
+                        )
 
-        if not improved_this_round:
             if verbose:
-                print("  No improvement — stopping early.")
-            break
+                print(f"  Round {round_idx + 1} done — accuracy: {best_accuracy:.4f}")
+
+            if not improved_this_round:
+                if verbose:
+                    print("  No improvement — stopping early.")
+                break
 
     # ── Write optimised config ────────────────────────────────
     output_config_path.parent.mkdir(parents=True, exist_ok=True)
@@ -230,7 +410,9 @@ def train(
             f"# Learned accuracy  : {best_accuracy:.4f}\n"
             "# ────────────────────────────────────────────────────────────────\n\n"
         )
-        yaml.dump(best_cfg, fh, default_flow_style=False, allow_unicode=True)
+        yaml.dump(
+            best_cfg, fh, Dumper=_SafeDumper, default_flow_style=False, allow_unicode=True
+        )
 
     if verbose:
         print(f"\nOptimised config saved to: {output_config_path}")
@@ -0,0 +1,122 @@
+"""Types — column-oriented note containers shared across the ML engine.
+
+Solver output and ground-truth annotations are both scored as a
+:class:`NoteArray`: one NumPy array per field instead of one dict per
+note, so metrics reduce to a few vector comparisons.
+
+Hands are encoded as ``L`` → 0, ``R`` → 1 (the solver's hand order).
+Lists of annotation dicts — the JSON / Streamlit schema — convert with
+:meth:`NoteArray.from_dicts` and :meth:`NoteArray.to_dicts`.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+
+# ── Hand encoding ─────────────────────────────────────────────
+HAND_NAMES: tuple[str, str] = ("L", "R")
+HAND_CODES: dict[str, int] = {"L": 0, "R": 1}
+
+# Fingers per hand in the solver's flat state layout
+_FINGERS_PER_HAND: int = 5
+
+
+@dataclass(frozen=True)
+class NoteArray:
+    """Per-note fingering annotations as parallel arrays.
+
+    Attributes:
+        onset_time: ``float64`` onset in seconds.
+        pitch: ``int16`` MIDI note number.
+        hand: ``int8`` hand code (``L`` → 0, ``R`` → 1).
+        finger: ``int8`` finger number (1–5).
+    """
+
+    onset_time: np.ndarray
+    pitch: np.ndarray
+    hand: np.ndarray
+    finger: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.hand)
+
+    def head(self, n: int) -> NoteArray:
+        """Return the first *n* notes (array views, no copy)."""
+        return NoteArray(
+            onset_time=self.onset_time[:n],
+            pitch=self.pitch[:n],
+            hand=self.hand[:n],
+            finger=self.finger[:n],
+        )
+
+    @classmethod
+    def from_dicts(cls, records: list[dict[str, Any]]) -> NoteArray:
+        """Build from annotation dicts (``onset_time``, ``pitch``, ``hand``, ``finger``).
+
+        Args:
+            records: Annotation dicts, e.g. the output of
+                :func:`solver.solve` or a ground-truth file.
+
+        Returns:
+            The equivalent :class:`NoteArray`.
+        """
+        n = len(records)
+        return cls(
+            onset_time=np.fromiter(
+                (r["onset_time"] for r in records), dtype=np.float64, count=n
+            ),
+            pitch=np.fromiter((r["pitch"] for r in records), dtype=np.int16, count=n),
+            hand=np.fromiter(
+                (HAND_CODES[r["hand"]] for r in records), dtype=np.int8, count=n
+            ),
+            finger=np.fromiter((r["finger"] for r in records), dtype=np.int8, count=n),
+        )
+
+    @classmethod
+    def from_states(cls, notes: list[dict[str, Any]], states: np.ndarray) -> NoteArray:
+        """Build from solver features and flat DP states.
+
+        Args:
+            notes: The feature dicts passed to the solver.
+            states: Flat state per note from :func:`solver.solve_states`
+                (``hand_index * 5 + finger - 1``).
+
+        Returns:
+            The solved fingering as a :class:`NoteArray`.
+        """
+        n = len(notes)
+        hand, finger_idx = np.divmod(states, _FINGERS_PER_HAND)
+        return cls(
+            onset_time=np.fromiter(
+                (note["start"] for note in notes), dtype=np.float64, count=n
+            ),
+            pitch=np.fromiter((note["pitch"] for note in notes), dtype=np.int16, count=n),
+            hand=hand.astype(np.int8),
+            finger=(finger_idx + 1).astype(np.int8),
+        )
+
+    def to_dicts(self) -> list[dict[str, Any]]:
+        """Convert back to annotation dicts (JSON-safe Python scalars).
+
+        Returns:
+            One dict per note with ``onset_time``, ``pitch``, ``hand``
+            (``"L"`` | ``"R"``) and ``finger``.
+        """
+        return [
+            {
+                "onset_time": onset_time,
+                "pitch": pitch,
+                "hand": HAND_NAMES[hand],
+                "finger": finger,
+            }
+            for onset_time, pitch, hand, finger in zip(
+                self.onset_time.tolist(),
+                self.pitch.tolist(),
+                self.hand.tolist(),
+                self.finger.tolist(),
+            )
+        ]
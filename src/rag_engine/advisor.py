@@ -6,9 +6,11 @@ and practice suggestions.
 
 Architecture:
     - **No embeddings** or vector retrieval yet (Phase 1 = structured prompting).
-    - **Lazy initialisation** — the OpenAI client is created inside
-      ``explain_fingering()``, never at import time.
-    - **No global state** — every call builds its own client instance.
+    - **Lazy initialisation** — the OpenAI client is created on the first
+      ``explain_fingering()`` call, never at import time.
+    - **One cached client** — ``.env`` loading, key lookup and client
+      construction happen once per process (``_get_client``); later
+      calls reuse the client and its connection pool.
     - **No side effects on import** — ``python-dotenv`` is loaded lazily.
     - **Deterministic** — ``temperature=0`` for reproducible outputs.
 
@@ -17,7 +19,7 @@ Environment:
 
         OPENAI_API_KEY=sk-...
 
-    The key is loaded via ``python-dotenv`` at call time.
+    The key is loaded via ``python-dotenv`` on the first call.
     It is never printed or logged.
 
 No network calls are made unless ``explain_fingering()`` is explicitly invoked.
@@ -25,47 +27,38 @@ No network calls are made unless ``explain_fingering()`` is explicitly invoked.
 
 from __future__ import annotations
 
+import functools
 from pathlib import Path
+from typing import Any
 
 
 # ── Project root (used to locate .env) ────────────────────────
 _PROJECT_ROOT: Path = Path(__file__).resolve().parents[2]
 
 
-def explain_fingering(context: str) -> str:
-    """Generate a structured explanation of piano fingering decisions.
-
-    Loads the API key from ``.env`` via ``python-dotenv``, initialises
-    the OpenAI client, and sends a deterministic (temperature=0)
-    chat completion request with a pedagogically-structured prompt.
-
-    Args:
-        context: A string containing the passage description,
-            fingering assignments, and summary statistics.
-            Example::
+@functools.lru_cache(maxsize=1)
+def _get_client() -> Any:
+    """Load ``.env``, read the API key and build the OpenAI client, once.
 
-                "Passage: C4→E4→G4→C5 (ascending C major arpeggio)
-                 Fingerings: R1→R2→R3→R5
-                 Hand switches: 0 | Stretches: 1"
+    Failures are not cached, so a later call retries (e.g. after the
+    key has been added).
 
     Returns:
-        A multi-section explanation string with:
-            - Technical Analysis
-            - Ergonomic Considerations
-            - Practice Strategy
-            - Alternative Fingering (optional)
+        An ``openai.OpenAI`` client.
 
-        If the API call fails, returns a human-readable error message
-        instead of raising an exception.
+    Raises:
+        ImportError: If python-dotenv or openai is not installed; the
+            message is user-facing.
+        ValueError: If ``OPENAI_API_KEY`` is not set.
     """
     # ── 1. Load environment lazily ────────────────────────────
     try:
         from dotenv import load_dotenv  # noqa: E402
     except ImportError:
-        return (
+        raise ImportError(
             "Error: python-dotenv is not installed. "
             "Install it with: pip install python-dotenv"
-        )
+        ) from None
 
     load_dotenv(dotenv_path=_PROJECT_ROOT / ".env")
 
@@ -83,12 +76,45 @@ def explain_fingering(context: str) -> str:
     try:
         import openai  # noqa: E402
     except ImportError:
-        return (
+        raise ImportError(
             "Error: openai package is not installed. "
             "Install it with: pip install openai"
-        )
+        ) from None
+
+    return openai.OpenAI(api_key=api_key)
+
 
-    client = openai.OpenAI(api_key=api_key)
+def explain_fingering(context: str) -> str:
+    """Generate a structured explanation of piano fingering decisions.
+
+    Uses the cached OpenAI client (see :func:`_get_client`) and sends a
+    deterministic (temperature=0) chat completion request with a
+    pedagogically-structured prompt.
+
+    Args:
+        context: A string containing the passage description,
+            fingering assignments, and summary statistics.
+            Example::
+
+                "Passage: C4→E4→G4→C5 (ascending C major arpeggio)
+                 Fingerings: R1→R2→R3→R5
+                 Hand switches: 0 | Stretches: 1"
+
+    Returns:
+        A multi-section explanation string with:
+            - Technical Analysis
+            - Ergonomic Considerations
+            - Practice Strategy
+            - Alternative Fingering (optional)
+
+        If the API call fails, returns a human-readable error message
+        instead of raising an exception.
+    """
+    # ── 1–2. Environment and client (cached) ──────────────────
+    try:
+        client = _get_client()
+    except ImportError as exc:
+        return str(exc)
 
     # ── 3. Construct structured prompt ────────────────────────
     system_prompt = (